@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 
+from structure_extraction import pipeline
 from structure_extraction.io import io
-from structure_extraction.transform import simplify, sort, breakdown, paginate
 from structure_extraction.utils import utils
 
 if __name__ == "__main__":
@@ -19,30 +19,18 @@ if __name__ == "__main__":
     transformed_text = io.make_the_soup(filename_in)
     # !! add schema test before continuing - ABBY schema
     if transformed_text:
-        # then we simplify the XML tree be sorting text and non-text blocks:
-        transformed_text = simplify.rearrange(transformed_text)
-        # !! add schema test before continuing -- homemade schema
-        # then we sort out headers and signatures, which may raise warnings:
-        transformed_text_guard, transformed_text, warning_headers, warning_signatures, warning_headers_corrected = sort.exclude_headers_signatures(transformed_text)
-        transformed_text = paginate.paginate(transformed_text)
-        # !! add schema test before continuing -- homemade schema
-        # then we separate the tree structure from the physical structure of the text:
-        transformed_text = breakdown.make_breakers(transformed_text)
+        # then we run the transformations (simplify, sort, paginate, breakdown) on the parsed XML tree:
+        result = pipeline.process_soup(transformed_text)
         # !! add schema test before continuing -- homemade schema
 
         # raising warnings:
-        utils.report(warning_headers, "HEADER")
-        utils.report(warning_signatures, "SIGNATURE")
-        utils.report(warning_headers_corrected, "CORRECT_HEADER")
-
-        # creating output files content:
-        final_xml_str = io.make_string(transformed_text)
-        final_guard_str = io.make_string(transformed_text_guard)
+        for topic in result.warnings:
+            utils.report(result.warnings[topic], topic)
 
         # creating output files names and writing the output:
         out_xml_file, out_guard, out_txt_file = io.make_out_filenames(filename_in, filename_out)
-        io.write_output(out_xml_file, final_xml_str)
-        io.write_output(out_guard, final_guard_str)
+        io.write_output(out_xml_file, result.xml)
+        io.write_output(out_guard, result.guard)
 
         # make plain text output
         # - recompose paragraphs
@@ -3,6 +3,18 @@
 from bs4 import BeautifulSoup
 from termcolor import colored
 
+def parse_the_soup(source):
+    """Parse an xml document held in memory and return its content as a bs4 object
+
+    :param source: content of the document
+    :type source: bytes, string or file-like object
+    :return: content of the document
+    :rtype: bs4.BeautifulSoup
+    """
+    # see make_the_soup() for the reason why we use the HTML (lxml) parser
+    return BeautifulSoup(source, "lxml")
+
+
 def make_the_soup(filename):
     """Read an xml document and return its content as a bs4 object
 
@@ -18,7 +30,7 @@ def make_the_soup(filename):
     # - the tree begins with extra html/body/... elements
     try:
         with open(filename, "r") as f:
-            soup = BeautifulSoup(f, "lxml")
+            soup = parse_the_soup(f)
     except Exception as e:
         print(colored("Error", "red", attrs=["bold"]), e)
         soup = False
@@ -68,4 +80,21 @@ def make_string(soup):
     :rtype: string
     """
     s = str(soup.prettify())
-    return s
\ No newline at end of file
+    return s
+
+
+def make_text(soup):
+    """ Transform a parsed XML tree made of <pb/>, <div>, <p> and <lb/> elements into plain text
+
+    Lines are separated by a line break and paragraphs by an empty line.
+
+    :param soup: parsed XML tree
+    :type soup: bs4.BeautifulSoup
+    :rtype: string
+    """
+    paragraphs = []
+    for p in soup.find_all("p"):
+        lines = [line.strip() for line in p.find_all(string=True) if line.strip()]
+        if len(lines) > 0:
+            paragraphs.append("\n".join(lines))
+    return "\n\n".join(paragraphs)
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+
+# this module chains the transformations applied to an ABBYY XML volume without touching the disk,
+# so that the extraction can be used as a library (main.py being a command line wrapper around it).
+# Each call works on its own parsed tree and does not share any state: calls can safely run in parallel threads.
+
+from collections import namedtuple
+
+from .io import io
+from .transform import simplify, sort, breakdown, paginate
+
+
+VolumeResult = namedtuple("VolumeResult", ["xml", "guard", "text", "pagination", "warnings", "metrics"])
+VolumeResult.__doc__ = """Result of the transformation of a volume
+
+:xml: output XML document
+:guard: XML document gathering the headers and signatures taken out of the output
+:text: plain text of the output
+:pagination: list of corrected page numbers (one per page), empty if it could not be calculated
+:warnings: dict of warning lists, keyed by topic (see utils.report)
+:metrics: dict describing the volume: number of pages of each type and list of page types (see simplify.classify_pages)
+"""
+
+
+def process_volume(source):
+    """Transform an ABBYY XML document held in memory and return the results as python objects
+
+    :param source: content of the ABBYY XML document
+    :type source: bytes, string or file-like object
+    :return: output XML, guard XML, plain text, pagination, warnings and metrics
+    :rtype: VolumeResult
+    """
+    return process_soup(io.parse_the_soup(source))
+
+
+def process_soup(soup):
+    """Transform a parsed ABBYY XML tree and return the results as python objects
+
+    :param soup: parsed XML tree, as returned by io.parse_the_soup() or io.make_the_soup()
+    :type soup: bs4.BeautifulSoup
+    :return: output XML, guard XML, plain text, pagination, warnings and metrics
+    :rtype: VolumeResult
+    """
+    # first we classify pages once, so that pages without text can take a shorter path through each step:
+    page_types = simplify.classify_pages(soup)
+    # then we simplify the XML tree be sorting text and non-text blocks:
+    transformed_text = simplify.rearrange(soup, page_types)
+    # then we sort out headers and signatures, which may raise warnings:
+    transformed_text_guard, transformed_text, warning_headers, warning_signatures, warning_headers_corrected = sort.exclude_headers_signatures(transformed_text, page_types)
+    warning_pagination = []
+    pagination = paginate.compute_pagination(transformed_text)
+    if pagination is not False:
+        transformed_text = paginate.inject_new_pagination(transformed_text, pagination)
+    else:
+        pagination = []
+        warning_pagination.append("Could not calculate new pagination.")
+    # then we separate the tree structure from the physical structure of the text:
+    transformed_text = breakdown.make_breakers(transformed_text, page_types)
+
+    warnings = {
+        "PAGINATION": warning_pagination,
+        "HEADER": warning_headers,
+        "SIGNATURE": warning_signatures,
+        "CORRECT_HEADER": warning_headers_corrected
+    }
+    metrics = {
+        "pages": len(page_types),
+        "text_pages": page_types.count("text"),
+        "figure_pages": page_types.count("figure"),
+        "empty_pages": page_types.count("empty"),
+        "page_types": page_types
+    }
+    return VolumeResult(
+        xml=io.make_string(transformed_text),
+        guard=io.make_string(transformed_text_guard),
+        text=io.make_text(transformed_text),
+        pagination=pagination,
+        warnings=warnings,
+        metrics=metrics
+    )
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 from bs4 import BeautifulSoup
 
-def make_breakers(soup):
+def make_breakers(soup, page_types=None):
     """Transform <page></page> into <pb/> and <line></line> in <lb/>
 
     This makes it possible to separate the XML representation from the physical structure of the text
@@ -11,13 +11,27 @@ def make_breakers(soup):
 
     :param soup: parsed XML tree
     :type soup: bs4.BeautifulSoup
+    :param page_types: page types as returned by simplify.classify_pages(), every page is treated as text if not given
+    :type page_types: list
     :return: parsed XML tree
     :rtype: bs4.BeautifulSoup
     """
     broken_soup = BeautifulSoup("<document></document>", "xml")
     all_pages = soup.find_all("page")
+    if page_types is None:
+        page_types = ["text"] * len(all_pages)
+
+    for page, page_type in zip(all_pages, page_types):
+        # pages without text only need a <pb/> followed by their figures, if any
+        if page_type != "text":
+            new_pb = broken_soup.new_tag("pb")
+            for k in page.attrs:
+                new_pb[k] = page.attrs[k]
+            broken_soup.document.append(new_pb)
+            for figure in page.find_all("figure", recursive=False):
+                broken_soup.document.append(figure)
+            continue
 
-    for page in all_pages:
         new_pb = BeautifulSoup("<temp><pb/></temp>", "xml")
         att_page = page.attrs  # dict listing page's attributes (key = attribute name)
         for k in att_page:
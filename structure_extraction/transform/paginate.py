@@ -148,20 +148,14 @@ def inject_new_pagination(soup, pagination):
     return soup
 
 
-def paginate(soup):
-    """Takes a parsed XML Tree containing pages, some of which have @pagenb attributes which may or may not be correct and calculate the correct pagination
-
-    This pagination matches the one displayed in the book from which the XML Tree was produced, it does not simply match the indexation of the page elements in the tree.
-    The value in @pagenb attributes was produced through OCR, which is the reason why it may or may not be correct.
-    We do this because we want to be able to find which book page the page elements corresponds to.
+def compute_pagination(soup):
+    """Calculate the correct pagination of a parsed XML Tree containing pages, some of which have @pagenb attributes
 
     :param soup: parsed XML Tree
     :type soup: bs4.BeautifulSoup
-    :return: parsed XML Tree
-    :rtype: bs4.BeautifulSoup
+    :return: False if no pagination could be calculated, list of page numbers otherwise
+    :rtype: Boolean or list
     """
-    logging.basicConfig(format='%(levelname)s:%(message)s')  # setting format for logging
-
     orig_pagination = list_page_numbers(soup)
     if len(orig_pagination) > 0:
         max_iterations = set_limit(orig_pagination)  # will not iterate more times than there are possible anchors in the list of page numbers
@@ -175,18 +169,29 @@ def paginate(soup):
                     error_margin = is_coherent(orig_pagination, new_pagination)
                     iterating += 1
                     anchor = get_anchor(orig_pagination, iterating)
-                paginated_soup = inject_new_pagination(soup, new_pagination)
-                return paginated_soup
+                return new_pagination
+    # this means there is no integer in the list of page numbers
+    return False
 
-            else:
-                # this means there is no integer in the list of page numbers
-                logging.warning("Could not calculate new pagination.")
-                return soup
-        else:
-            # this means there is no integer in the list of page numbers
-            logging.warning("Could not calculate new pagination.")
-            return soup
+
+def paginate(soup):
+    """Takes a parsed XML Tree containing pages, some of which have @pagenb attributes which may or may not be correct and calculate the correct pagination
+
+    This pagination matches the one displayed in the book from which the XML Tree was produced, it does not simply match the indexation of the page elements in the tree.
+    The value in @pagenb attributes was produced through OCR, which is the reason why it may or may not be correct.
+    We do this because we want to be able to find which book page the page elements corresponds to.
+
+    :param soup: parsed XML Tree
+    :type soup: bs4.BeautifulSoup
+    :return: parsed XML Tree
+    :rtype: bs4.BeautifulSoup
+    """
+    logging.basicConfig(format='%(levelname)s:%(message)s')  # setting format for logging
+
+    new_pagination = compute_pagination(soup)
+    if new_pagination is not False:
+        paginated_soup = inject_new_pagination(soup, new_pagination)
+        return paginated_soup
     else:
-        # this means there is no integer in the list of page numbers
         logging.warning("Could not calculate new pagination.")
-        return soup
+        return soup
\ No newline at end of file
@@ -1,27 +1,71 @@
 # -*- coding: utf-8 -*-
 from bs4 import BeautifulSoup
 
-def rearrange(soup):
+def classify_pages(soup):
+    """Classify each page of an XML ABBY tree according to the blocks it contains
+
+    A page is "text" if it contains at least one text block, "figure" if it only contains
+    other types of blocks (pictures, tables, separators...) and "empty" if it contains no block at all.
+
+    :param soup: parsed XML tree
+    :type soup: bs4.BeautifulSoup
+    :return: list of page types, in the order of the pages
+    :rtype: list
+    """
+    page_types = []
+    for page in soup.find_all("page"):
+        # blocks are direct children of the page in ABBY's schema, no need to look further down the tree
+        all_blocks = page.find_all("block", recursive=False)
+        if len(all_blocks) == 0:
+            page_types.append("empty")
+        elif any(block["blocktype"] == "Text" for block in all_blocks):
+            page_types.append("text")
+        else:
+            page_types.append("figure")
+    return page_types
+
+
+def make_figure(block):
+    """Transform a non-text block into an empty <figure> element keeping only its type
+
+    :param block: block element
+    :type block: bs4.element.Tag
+    """
+    block.name = "figure"
+    block["type"] = block["blocktype"]
+    attrs_list = block.attrs
+    for attr in list(attrs_list):
+        if attr != "type":
+            del block[attr]
+    block.clear()
+
+
+def rearrange(soup, page_types=None):
     """Simplify XML ABBY structure and sort text blocks from other types of blocks
 
     :param soup: parsed XML tree
     :type soup: bs4.BeautifulSoup
+    :param page_types: page types as returned by classify_pages(), calculated if not given
+    :type page_types: list
     :return: parsed XML tree
     :rtype: bs4.BeautifulSoup
     """
     all_pages = soup.find_all("page")
-    for page in all_pages:
+    if page_types is None:
+        page_types = classify_pages(soup)
+    for page, page_type in zip(all_pages, page_types):
+        # empty pages have nothing to rearrange and figure-only pages only need their blocks turned into figures
+        if page_type == "empty":
+            continue
+        elif page_type == "figure":
+            for block in page.find_all("block", recursive=False):
+                make_figure(block)
+            continue
         all_blocks = page.find_all("block")
         for block in all_blocks:
             # modify figure type blocks, including tables
             if block["blocktype"] != "Text":
-                block.name = "figure"
-                block["type"] = block["blocktype"]
-                attrs_list = block.attrs
-                for attr in list(attrs_list):
-                    if attr != "type":
-                        del block[attr]
-                block.clear()
+                make_figure(block)
             # rearrange text type blocks
             else:
                 if block.region:
@@ -15,6 +15,7 @@
 # - calculate the correct content of the header and give the corrected and original version as attributes to the page
 
 from bs4 import BeautifulSoup
+from bs4.element import Tag
 import stringdist
 
 from copy import copy
@@ -34,11 +35,24 @@ def correct_headers(s):
     return distance, groundtruth.headers[mark]
 
 
-def exclude_headers_signatures(soup):
+def copy_empty(tag):
+    """Copy an element and its attributes, but not its content
+
+    :param tag: element to copy
+    :type tag: bs4.element.Tag
+    :return: empty copy of the element
+    :rtype: bs4.element.Tag
+    """
+    return Tag(None, tag.builder, tag.name, tag.namespace, tag.prefix, dict(tag.attrs), is_xml=tag.is_xml)
+
+
+def exclude_headers_signatures(soup, page_types=None):
     """Sort headers and signatures from the body of text and give each element an id
     
     :param soup: parsed XML tree
     :rtype soup: bs4.BeautifulSoup
+    :param page_types: page types as returned by simplify.classify_pages(), every page is treated as text if not given
+    :type page_types: list
     :return: parsed XML trees and lists of warnings
     :rtype: tuple
     """
@@ -50,10 +64,16 @@ def exclude_headers_signatures(soup):
     warning_signatures = []
     warning_headers_corrected = []
     count_page = 0
+    if page_types is None:
+        page_types = ["text"] * len(all_pages)
     # reading each individual page and its content to create identifiers (page/div/p/line)
-    for page in all_pages:
+    for page, page_type in zip(all_pages, page_types):
         count_page += 1
         page["id"] = "page%s" % count_page
+        # pages without text have no header nor signature: the guard only keeps an empty copy of them
+        if page_type != "text":
+            guard_soup.document.append(copy_empty(page))
+            continue
         page_f = copy(page)
         page_f.clear()
         all_divs = page.find_all("div")
@@ -25,7 +25,11 @@ def report(warn_list, topic):
     :return:
     """
     logging.basicConfig(format='%(levelname)s:%(message)s')
-    if topic == "SIGNATURE":
+    if topic == "PAGINATION":
+        for warn_string in warn_list:
+            logging.warning(warn_string)
+
+    elif topic == "SIGNATURE":
         for warn_id, warn_string in warn_list:
             message = "Might be a {} but was left in the output: '{}':\n\t{}".format(
                 colored(topic, "yellow"),